@@ -3,22 +3,49 @@ from __future__ import annotations
 
 import curses
 import curses.ascii
-import json
+import http.client
 import math
 import os
+import queue
 import random
+import re
 import subprocess
 import sys
+import threading
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import urllib.error
+import urllib.parse
 import urllib.request
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    import json
+
+
+def json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
 CONFIG_DIR = Path.home() / ".ccode"
 CONFIG_PATH = CONFIG_DIR / "config.json"
 DEFAULT_BASE_URL = "http://127.0.0.1:8317"
+MAX_RESPONSE_BYTES = 4 * 1024 * 1024
+MAX_ERROR_BODY_BYTES = 1024
 MODEL_KEYS = ("opus", "sonnet", "haiku")
+LOGO_START_Y = 1
 MODEL_LABELS = {
     "opus": "OPUS",
     "sonnet": "SONNET",
@@ -34,6 +61,7 @@ DEFAULT_TOGGLES = {
     "DISABLE_COST_WARNINGS": 1,
     "CLAUDE_CODE_DISABLE_NONESSENTIAL_TRAFFIC": 1,
 }
+TOGGLE_KEYS = frozenset((curses.KEY_ENTER, 10, 13, ord(" ")))
 
 
 def default_config() -> dict[str, Any]:
@@ -52,11 +80,11 @@ def default_config() -> dict[str, Any]:
 def load_config() -> dict[str, Any]:
     config = default_config()
     try:
-        raw = CONFIG_PATH.read_text()
-        data = json.loads(raw)
+        raw = CONFIG_PATH.read_bytes()
+        data = json_loads(raw)
     except FileNotFoundError:
         return config
-    except (OSError, json.JSONDecodeError):
+    except (OSError, ValueError):
         return config
     if not isinstance(data, dict):
         return config
@@ -94,7 +122,9 @@ def load_config() -> dict[str, Any]:
 
 def save_config(config: dict[str, Any]) -> None:
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    CONFIG_PATH.write_text(json.dumps(config, indent=2))
+    tmp_path = CONFIG_PATH.with_suffix(".json.tmp")
+    tmp_path.write_bytes(json_dumps(config))
+    os.replace(tmp_path, CONFIG_PATH)
 
 
 def mask_secret(value: str) -> str:
@@ -112,12 +142,12 @@ def fetch_models(base_url: str, api_key: str) -> list[dict[str, str]]:
     try:
         with urllib.request.urlopen(request, timeout=10) as response:
             status = response.getcode()
-            body_bytes = response.read()
+            body_bytes = response.read(MAX_RESPONSE_BYTES + 1)
     except urllib.error.HTTPError as exc:
         body = ""
         try:
             if exc.fp is not None:
-                body = exc.fp.read().decode("utf-8", "replace").strip()
+                body = exc.fp.read(MAX_ERROR_BODY_BYTES).decode("utf-8", "replace").strip()
         except Exception:
             body = ""
         if len(body) > 200:
@@ -126,16 +156,22 @@ def fetch_models(base_url: str, api_key: str) -> list[dict[str, str]]:
         raise RuntimeError(f"HTTP {exc.code}: {message}") from exc
     except (urllib.error.URLError, OSError) as exc:
         raise RuntimeError(f"Request failed: {exc}") from exc
+    return parse_models_response(status, body_bytes)
+
 
+def parse_models_response(status: int, body_bytes: bytes) -> list[dict[str, str]]:
     if status != 200:
-        body = body_bytes.decode("utf-8", "replace").strip()
+        body = body_bytes[:MAX_ERROR_BODY_BYTES].decode("utf-8", "replace").strip()
         if len(body) > 200:
             body = f"{body[:200]}..."
         message = body or "No response body"
         raise RuntimeError(f"HTTP {status}: {message}")
 
+    if len(body_bytes) > MAX_RESPONSE_BYTES:
+        raise RuntimeError(f"Response larger than {MAX_RESPONSE_BYTES} bytes")
+
     try:
-        payload = json.loads(body_bytes.decode("utf-8", "replace"))
+        payload = json_loads(body_bytes)
     except ValueError as exc:
         raise RuntimeError("Invalid JSON response") from exc
 
@@ -155,15 +191,106 @@ def fetch_models(base_url: str, api_key: str) -> list[dict[str, str]]:
     return models
 
 
+class ModelsClient:
+    # Keeps one HTTP(S) connection to the gateway open across refreshes so only the
+    # first refresh pays for the TCP/TLS handshake. Used from a single worker thread.
+    def __init__(self) -> None:
+        self._origin: tuple[str, str] | None = None
+        self._conn: http.client.HTTPConnection | None = None
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def fetch(self, base_url: str, api_key: str) -> list[dict[str, str]]:
+        parts = urllib.parse.urlsplit(f"{base_url.rstrip('/')}/v1/models")
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            raise RuntimeError(f"Request failed: unsupported base URL {base_url!r}")
+        if parts.scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(
+            parts.hostname or ""
+        ):
+            # http.client does not honour *_proxy variables; let urllib handle them.
+            return fetch_models(base_url, api_key)
+
+        origin = (parts.scheme, parts.netloc)
+        if origin != self._origin:
+            self.close()
+            self._origin = origin
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        headers = {"Authorization": f"Bearer {api_key}"}
+        reused = self._conn is not None
+        try:
+            try:
+                status, location, body_bytes = self._get(path, headers)
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if not reused:
+                    raise
+                # The server dropped the idle keep-alive connection; retry on a fresh one.
+                self.close()
+                status, location, body_bytes = self._get(path, headers)
+        except (http.client.HTTPException, OSError) as exc:
+            self.close()
+            raise RuntimeError(f"Request failed: {exc}") from exc
+        if 300 <= status < 400 and location:
+            # http.client does not follow redirects; let urllib handle them.
+            return fetch_models(base_url, api_key)
+        return parse_models_response(status, body_bytes)
+
+    def _get(self, path: str, headers: dict[str, str]) -> tuple[int, str | None, bytes]:
+        if self._conn is None:
+            scheme, netloc = self._origin
+            if scheme == "https":
+                self._conn = http.client.HTTPSConnection(netloc, timeout=10)
+            else:
+                self._conn = http.client.HTTPConnection(netloc, timeout=10)
+        self._conn.request("GET", path, headers=headers)
+        response = self._conn.getresponse()
+        body_bytes = response.read(MAX_RESPONSE_BYTES + 1)
+        if not response.isclosed():
+            # Oversized body left unread; the connection cannot be reused.
+            self.close()
+        return response.status, response.getheader("Location"), body_bytes
+
+
+class BackgroundWorker:
+    # Runs submitted calls one at a time on a daemon thread, so an in-flight request
+    # never keeps the process alive after the UI quits (unlike ThreadPoolExecutor,
+    # whose workers are joined at interpreter exit).
+    def __init__(self) -> None:
+        self._jobs: queue.SimpleQueue[
+            tuple[Future[Any], Callable[..., Any], tuple[Any, ...]]
+        ] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="ccode-worker", daemon=True)
+        self._thread.start()
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future[Any]:
+        future: Future[Any] = Future()
+        self._jobs.put((future, fn, args))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            future, fn, args = self._jobs.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+
 def validate_models(config: dict[str, Any], models: list[dict[str, str]]) -> bool:
     valid = {(item["owned_by"], item["id"]) for item in models}
     changed = False
     for key in MODEL_KEYS:
-        entry = config["models"].get(key, {})
-        owned_by = entry.get("owned_by")
-        model_id = entry.get("id")
+        entry = config["models"][key]
+        owned_by = entry["owned_by"]
+        model_id = entry["id"]
         if not owned_by or not model_id or (owned_by, model_id) not in valid:
-            if entry.get("owned_by") is not None or entry.get("id") is not None:
+            if owned_by is not None or model_id is not None:
                 config["models"][key] = {"owned_by": None, "id": None}
                 changed = True
     return changed
@@ -179,8 +306,8 @@ def build_models_by_owner(
         if not isinstance(owned_by, str) or not isinstance(model_id, str):
             continue
         by_owner.setdefault(owned_by, []).append(model_id)
-    for owner in by_owner:
-        by_owner[owner] = sorted(by_owner[owner])
+    for model_ids in by_owner.values():
+        model_ids.sort()
     return by_owner
 
 
@@ -194,7 +321,6 @@ def model_options(models_by_owner: dict[str, list[str]], owner: str) -> list[str
 
 def update_model_owner(config: dict[str, Any], key: str, owner: str | None) -> None:
     config["models"][key] = {"owned_by": owner if owner else None, "id": None}
-    save_config(config)
 
 
 def update_model_id(
@@ -204,7 +330,51 @@ def update_model_id(
         config["models"][key] = {"owned_by": owner, "id": model_id}
     else:
         config["models"][key] = {"owned_by": owner if owner else None, "id": None}
-    save_config(config)
+
+# One-degree sine lookup used by the per-glyph logo animation.
+SIN_TABLE = [math.sin(math.radians(i)) for i in range(360)]
+RAD_TO_DEG = 180 / math.pi
+MASK64 = (1 << 64) - 1
+GLITCH_CHARS = "!@#$%&?<>"
+
+
+def logo_color_period(pair_count: int) -> int:
+    # The colour bias repeats every 2 * pair_count frames and the sine every 12*pi
+    # frames; use the first common period whose sine seam is below 0.06 rad.
+    step = 2 * pair_count
+    period = step
+    while abs(period / 6 - round(period / (12 * math.pi)) * 2 * math.pi) >= 0.06:
+        period += step
+    return period
+
+
+def wave_positions(
+    frame: int,
+    start_y: int,
+    base_x: int,
+    rows: tuple[int, ...],
+    cols: tuple[int, ...],
+    jitter_phases: tuple[float, ...],
+    row_count: int,
+    col_count: int,
+) -> tuple[list[int], list[int]]:
+    # Pure numeric kernel for the wave style over parallel per-cell sequences:
+    # phases are precomputed in degrees, so each glyph costs one table lookup.
+    wave_y = [
+        start_y + SIN_TABLE[int(((frame / 6) + (col / 8)) * RAD_TO_DEG) % 360] * 0.6
+        for col in range(col_count)
+    ]
+    dx = [
+        base_x + int(round(SIN_TABLE[int(((frame / 8) + row) * RAD_TO_DEG) % 360] * 1.5))
+        for row in range(row_count)
+    ]
+    frame_deg = (frame / 3) * RAD_TO_DEG
+    draw_ys = [
+        int(round(row + wave_y[col] + SIN_TABLE[int(frame_deg + phase) % 360] * 0.4))
+        for row, col, phase in zip(rows, cols, jitter_phases)
+    ]
+    draw_xs = [col + dx[row] for row, col in zip(rows, cols)]
+    return draw_ys, draw_xs
 
 
 LOGOS = [
@@ -237,19 +407,23 @@ LOGOS = [
 ]
 
 
-def build_env(config: dict[str, Any], masked: bool = False) -> dict[str, str]:
-    env = os.environ.copy()
+def build_env(
+    config: dict[str, Any],
+    masked: bool = False,
+    toggle_env: dict[str, str] | None = None,
+) -> dict[str, str]:
+    env: dict[str, str] = {}
     base_url = config.get("base_url", "")
     api_key = config.get("api_key", "")
     env["ANTHROPIC_BASE_URL"] = base_url
     env["ANTHROPIC_AUTH_TOKEN"] = mask_secret(api_key) if masked else api_key
     for key in MODEL_KEYS:
-        entry = config["models"].get(key, {})
-        model_id = entry.get("id")
+        model_id = config["models"][key]["id"]
         if model_id:
             env[f"ANTHROPIC_DEFAULT_{key.upper()}_MODEL"] = model_id
-    for key, value in config.get("toggles", {}).items():
-        env[key] = str(value)
+    if toggle_env is None:
+        toggle_env = {key: str(value) for key, value in config.get("toggles", {}).items()}
+    env.update(toggle_env)
     return env
 
 
@@ -259,20 +433,22 @@ def validate_launch_requirements(config: dict[str, Any]) -> str | None:
     if not base_url or not api_key:
         return "Base URL and API key are required."
     for key in MODEL_KEYS:
-        entry = config["models"].get(key, {})
-        if not entry.get("owned_by") or not entry.get("id"):
+        entry = config["models"][key]
+        if not entry["owned_by"] or not entry["id"]:
             return "OPUS, SONNET, and HAIKU selections are required."
     return None
 
 
-def launch_claude(config: dict[str, Any], args: list[str]) -> str | None:
+def launch_claude(
+    config: dict[str, Any], args: list[str], toggle_env: dict[str, str] | None = None
+) -> str | None:
     base_url = config.get("base_url", "").strip()
     api_key = config.get("api_key", "").strip()
     if not base_url or not api_key:
         return "Missing base URL or API key."
-    env = build_env(config, masked=False)
+    overrides = build_env(config, masked=False, toggle_env=toggle_env)
     try:
-        subprocess.run(["claude", *args], check=True, env=env)
+        subprocess.run(["claude", *args], check=True, env={**os.environ, **overrides})
     except FileNotFoundError:
         return "Could not find 'claude' on PATH."
     except subprocess.CalledProcessError as exc:
@@ -280,8 +456,9 @@ def launch_claude(config: dict[str, Any], args: list[str]) -> str | None:
     return None
 
 
-def addstr_safe(stdscr: curses.window, y: int, x: int, text: str, attr: int = 0) -> None:
-    height, width = stdscr.getmaxyx()
+def addstr_clipped(
+    stdscr: curses.window, height: int, width: int, y: int, x: int, text: str, attr: int = 0
+) -> None:
     if y < 0 or y >= height:
         return
     if x < 0:
@@ -298,26 +475,65 @@ def addstr_safe(stdscr: curses.window, y: int, x: int, text: str, attr: int = 0)
         return
 
 
+def addstr_safe(stdscr: curses.window, y: int, x: int, text: str, attr: int = 0) -> None:
+    height, width = stdscr.getmaxyx()
+    addstr_clipped(stdscr, height, width, y, x, text, attr)
+
+
+def addstr_runs(
+    stdscr: curses.window, height: int, width: int, y: int, x: int, text: str, attrs: list[int]
+) -> None:
+    start = 0
+    attr = attrs[0]
+    for end in range(1, len(attrs)):
+        if attrs[end] != attr:
+            addstr_clipped(stdscr, height, width, y, x + start, text[start:end], attr)
+            start = end
+            attr = attrs[end]
+    addstr_clipped(stdscr, height, width, y, x + start, text[start:], attr)
+
+
 class CursesApp:
+    __slots__ = (
+        "args", "config", "models_data", "models_by_owner", "_owner_options",
+        "status_message", "active_screen", "main_focus_row", "main_focus_field",
+        "config_fields", "config_focus_index", "_toggle_env", "config_cursor",
+        "_edit_bufs", "should_exit", "frame", "use_color", "color_pairs", "_attr_lut",
+        "_dims", "_static_dirty", "logo_palette", "logo_lines", "_logo_max_len",
+        "_logo_cells", "_cell_rows", "_cell_cols", "_cell_chars", "_wave_phases",
+        "_logo_segments", "render_style", "_rng_state", "_worker", "_models_client",
+        "_models_future", "_models_request", "_config_dirty", "_last_dirty_frame",
+        "_mask_cache",
+    )
+
     def __init__(self, args: list[str]) -> None:
         self.args = args
         self.config = load_config()
         self.models_data: list[dict[str, str]] | None = None
         self.models_by_owner: dict[str, list[str]] = {}
+        self._owner_options: list[str] = []
         self.status_message = ""
         self.active_screen = "main"
         self.main_focus_row = 0
         self.main_focus_field = 0
         self.config_fields = ["base_url", "api_key", *TOGGLE_LABELS.keys()]
         self.config_focus_index = 0
+        self._toggle_env = {key: str(value) for key, value in self.config["toggles"].items()}
         self.config_cursor = {
             "base_url": len(self.config.get("base_url", "")),
             "api_key": len(self.config.get("api_key", "")),
         }
+        # Text fields are edited in place and joined back into config on flush.
+        self._edit_bufs = {
+            field: list(self.config.get(field, "")) for field in self.config_cursor
+        }
         self.should_exit = False
         self.frame = 0
         self.use_color = False
         self.color_pairs: list[int] = []
+        self._attr_lut: list[list[list[int]] | None] = []
+        self._dims = (0, 0)
+        self._static_dirty = True
         self.logo_palette = [
             (curses.COLOR_CYAN, curses.COLOR_BLUE),
             (curses.COLOR_BLUE, curses.COLOR_MAGENTA),
@@ -326,27 +542,80 @@ class CursesApp:
             (curses.COLOR_YELLOW, curses.COLOR_GREEN),
         ]
         self.logo_lines = random.choice(LOGOS)
+        self._logo_max_len = max(map(len, self.logo_lines))
+        self._logo_cells = [
+            (row, col, ch)
+            for row, line in enumerate(self.logo_lines)
+            for col, ch in enumerate(line)
+            if ch != " "
+        ]
+        self._cell_rows = tuple(row for row, _col, _ch in self._logo_cells)
+        self._cell_cols = tuple(col for _row, col, _ch in self._logo_cells)
+        self._cell_chars = tuple(ch for _row, _col, ch in self._logo_cells)
+        self._wave_phases = tuple(
+            (row * 1.3 + col / 5) * RAD_TO_DEG
+            for row, col in zip(self._cell_rows, self._cell_cols)
+        )
+        self._logo_segments = [
+            (row, match.start(), match.group())
+            for row, line in enumerate(self.logo_lines)
+            for match in re.finditer(r"[^ ]+", line)
+        ]
         self.render_style = random.choice(["wave", "pulse", "glitch", "rain"])
+        self._rng_state = random.getrandbits(64) | 1
+        self._worker = BackgroundWorker()
+        self._models_client = ModelsClient()
+        self._models_future: Future[list[dict[str, str]]] | None = None
+        self._models_request: tuple[str, str] = ("", "")
+        self._config_dirty = False
+        self._last_dirty_frame = 0
+        self._mask_cache: tuple[tuple[int, str, str], str] | None = None
         self.update_models_by_owner()
 
     def update_models_by_owner(self) -> None:
         self.models_by_owner = build_models_by_owner(self.models_data)
+        self._owner_options = owner_options(self.models_by_owner)
 
-    def fetch_and_store_models(
-        self, base_url: str, api_key: str, save: bool = True
-    ) -> str | None:
-        try:
-            models = fetch_models(base_url, api_key)
-        except RuntimeError as exc:
-            return str(exc)
+    def store_models(self, base_url: str, api_key: str, models: list[dict[str, str]]) -> None:
         self.models_data = models
+        credentials_changed = (
+            self.config["base_url"] != base_url or self.config["api_key"] != api_key
+        )
         self.config["base_url"] = base_url
         self.config["api_key"] = api_key
+        self._edit_bufs = {"base_url": list(base_url), "api_key": list(api_key)}
         changed = validate_models(self.config, models)
-        if save or changed:
+        # An unchanged refresh leaves nothing new to persist.
+        if changed or credentials_changed:
             save_config(self.config)
+            self._config_dirty = False
         self.update_models_by_owner()
-        return None
+
+    def mark_config_dirty(self) -> None:
+        self._config_dirty = True
+        self._last_dirty_frame = self.frame
+
+    def field_text(self, field: str) -> str:
+        return "".join(self._edit_bufs[field])
+
+    def sync_edit_buffers(self) -> None:
+        for field in self._edit_bufs:
+            self.config[field] = self.field_text(field)
+
+    def flush_config(self) -> None:
+        if not self._config_dirty:
+            return
+        self.sync_edit_buffers()
+        save_config(self.config)
+        self._config_dirty = False
+
+    def masked_api_key(self, value: str) -> str:
+        # mask_secret only looks at the length and the first/last four characters.
+        fingerprint = (len(value), value[:4], value[-4:])
+        cache = self._mask_cache
+        if cache is None or cache[0] != fingerprint:
+            cache = self._mask_cache = (fingerprint, mask_secret(value))
+        return cache[1]
 
     def refresh_models(self) -> None:
         self.status_message = ""
@@ -355,10 +624,32 @@ class CursesApp:
         if not base_url or not api_key:
             self.status_message = "Base URL and API key are required. Open config with c."
             return
-        error = self.fetch_and_store_models(base_url, api_key)
-        if error:
-            self.status_message = error
+        self._models_request = (base_url, api_key)
+        self._models_future = self._worker.submit(
+            self._models_client.fetch, base_url, api_key
+        )
+        self.status_message = "Fetching models..."
+
+    def poll_models_future(self) -> None:
+        future = self._models_future
+        if future is None or not future.done():
+            return
+        self._models_future = None
+        self._static_dirty = True
+        base_url, api_key = self._models_request
+        current = (
+            self.field_text("base_url").strip(),
+            self.field_text("api_key").strip(),
+        )
+        if current != (base_url, api_key):
+            # Credentials were edited while the request was in flight.
+            return
+        try:
+            models = future.result()
+        except RuntimeError as exc:
+            self.status_message = str(exc)
             return
+        self.store_models(base_url, api_key, models)
         self.status_message = "Models refreshed."
 
     def init_colors(self) -> None:
@@ -379,15 +670,27 @@ class CursesApp:
                 break
             self.color_pairs.append(pair_id)
             pair_id += 1
-
-    def logo_color_attr(self, line_index: int, col_index: int) -> int:
-        if not self.use_color or not self.color_pairs:
-            return 0
-        wave = math.sin((self.frame / 6) + (line_index / 2) + (col_index / 6))
-        bias = (line_index + col_index + self.frame // 2) % len(self.color_pairs)
-        idx = int((wave + 1) * 0.5 * (len(self.color_pairs) - 1))
-        pair_id = self.color_pairs[(idx + bias) % len(self.color_pairs)]
-        return curses.color_pair(pair_id)
+        if self.color_pairs:
+            self._attr_lut = [None] * logo_color_period(len(self.color_pairs))
+
+    def logo_color_frame(self) -> list[list[int]]:
+        # Per-frame [line][col] colour attributes, built lazily once per phase.
+        phase = self.frame % len(self._attr_lut)
+        rows = self._attr_lut[phase]
+        if rows is None:
+            count = len(self.color_pairs)
+            pair_attrs = [curses.color_pair(pair_id) for pair_id in self.color_pairs]
+            rows = []
+            for line_index in range(len(self.logo_lines)):
+                row = []
+                for col_index in range(self._logo_max_len):
+                    wave = math.sin((phase / 6) + (line_index / 2) + (col_index / 6))
+                    bias = (line_index + col_index + phase // 2) % count
+                    idx = int((wave + 1) * 0.5 * (count - 1))
+                    row.append(pair_attrs[(idx + bias) % count])
+                rows.append(row)
+            self._attr_lut[phase] = rows
+        return rows
 
     def render_logo(self, stdscr: curses.window, start_y: int) -> None:
         if self.render_style == "wave":
@@ -402,103 +705,115 @@ class CursesApp:
             self.render_style_wave(stdscr, start_y)
 
     def render_style_wave(self, stdscr: curses.window, start_y: int) -> None:
-        lines = self.logo_lines
-        height, width = stdscr.getmaxyx()
-        max_len = max(len(line) for line in lines)
-        base_x = max(0, (width - max_len) // 2)
-        for row, line in enumerate(lines):
-            for col, ch in enumerate(line):
-                if ch == " ":
-                    continue
-                wave_y = math.sin((self.frame / 6) + (col / 8)) * 0.6
-                jitter = math.sin((self.frame / 3) + (row * 1.3 + col / 5)) * 0.4
-                draw_y = int(round(start_y + row + wave_y + jitter))
-                dx = int(round(math.sin((self.frame / 8) + row) * 1.5))
-                draw_x = base_x + col + dx
-                shimmer = ((self.frame + col + row * 3) % 18 == 0)
-                attr = self.logo_color_attr(row, col)
-                if shimmer:
-                    attr |= curses.A_BOLD
-                addstr_safe(stdscr, draw_y, draw_x, ch, attr)
+        height, width = self._dims
+        base_x = max(0, (width - self._logo_max_len) // 2)
+        frame = self.frame
+        rows = self._cell_rows
+        cols = self._cell_cols
+        draw_ys, draw_xs = wave_positions(
+            frame,
+            start_y,
+            base_x,
+            rows,
+            cols,
+            self._wave_phases,
+            len(self.logo_lines),
+            self._logo_max_len,
+        )
+        color_rows = self.logo_color_frame() if self.use_color and self.color_pairs else None
+        bold = curses.A_BOLD
+        attrs = [
+            (color_rows[row][col] if color_rows else 0)
+            | (bold if (frame + col + row * 3) % 18 == 0 else 0)
+            for row, col in zip(rows, cols)
+        ]
+        for ch, draw_y, draw_x, attr in zip(self._cell_chars, draw_ys, draw_xs, attrs):
+            addstr_clipped(stdscr, height, width, draw_y, draw_x, ch, attr)
 
     def render_style_pulse(self, stdscr: curses.window, start_y: int) -> None:
-        lines = self.logo_lines
-        height, width = stdscr.getmaxyx()
-        max_len = max(len(line) for line in lines)
-        base_x = max(0, (width - max_len) // 2)
-
-        for row, line in enumerate(lines):
-            for col, ch in enumerate(line):
-                if ch == " ":
-                    continue
-
-                attr = 0
-                if self.use_color and self.color_pairs:
-                    # Gradient pulse
-                    idx = (col + row + self.frame // 3) % len(self.color_pairs)
-                    attr = curses.color_pair(self.color_pairs[idx])
-                    # Gentle shimmer
-                    if (self.frame + col + row) % 20 < 10:
-                        attr |= curses.A_BOLD
-
-                addstr_safe(stdscr, start_y + row, base_x + col, ch, attr)
+        height, width = self._dims
+        base_x = max(0, (width - self._logo_max_len) // 2)
+        if not (self.use_color and self.color_pairs):
+            for row, col, text in self._logo_segments:
+                addstr_clipped(stdscr, height, width, start_y + row, base_x + col, text)
+            return
+
+        pair_attrs = [curses.color_pair(pair_id) for pair_id in self.color_pairs]
+        pair_count = len(pair_attrs)
+        frame = self.frame
+        shift = frame // 3
+        bold = curses.A_BOLD
+        # Both effects depend only on row + col, so build one attribute per diagonal.
+        diagonals = [
+            # Gradient pulse, with a gentle shimmer
+            pair_attrs[(diag + shift) % pair_count]
+            | (bold if (frame + diag) % 20 < 10 else 0)
+            for diag in range(len(self.logo_lines) + self._logo_max_len)
+        ]
+
+        for row, col, text in self._logo_segments:
+            attrs = diagonals[row + col : row + col + len(text)]
+            addstr_runs(stdscr, height, width, start_y + row, base_x + col, text, attrs)
 
     def render_style_glitch(self, stdscr: curses.window, start_y: int) -> None:
-        lines = self.logo_lines
-        height, width = stdscr.getmaxyx()
-        max_len = max(len(line) for line in lines)
-        base_x = max(0, (width - max_len) // 2)
-
-        for row, line in enumerate(lines):
-            for col, ch in enumerate(line):
-                if ch == " ":
-                    continue
-
-                draw_y = start_y + row
-                draw_x = base_x + col
-                attr = 0
-
-                if self.use_color and self.color_pairs:
-                    idx = (row + col) % len(self.color_pairs)
-                    attr = curses.color_pair(self.color_pairs[idx])
-
-                # Glitch effect: random chance to modify drawing
-                if random.random() < 0.03:
-                    glitch_type = random.randint(0, 2)
-                    if glitch_type == 0:
-                        # Jitter position
-                        draw_x += random.randint(-1, 1)
-                        draw_y += random.randint(-1, 0) # Only up/same
-                    elif glitch_type == 1:
-                        # Change character
-                        ch = random.choice("!@#$%&?<>")
-                    elif glitch_type == 2:
-                        attr |= curses.A_REVERSE
-
-                addstr_safe(stdscr, draw_y, draw_x, ch, attr)
+        height, width = self._dims
+        base_x = max(0, (width - self._logo_max_len) // 2)
+        use_color = self.use_color and bool(self.color_pairs)
+        pair_attrs = [curses.color_pair(pair_id) for pair_id in self.color_pairs]
+        pair_count = len(pair_attrs)
+        rng = self._rng_state
+
+        for row, col, ch in self._logo_cells:
+            draw_y = start_y + row
+            draw_x = base_x + col
+            attr = 0
+
+            if use_color:
+                attr = pair_attrs[(row + col) % pair_count]
+
+            # xorshift64; one draw supplies every random decision for this cell
+            rng ^= (rng << 13) & MASK64
+            rng ^= rng >> 7
+            rng ^= (rng << 17) & MASK64
+
+            # Glitch effect: ~3% chance (8/256) to modify drawing
+            if (rng & 0xFF) < 8:
+                glitch_type = ((rng >> 8) & 0xFFFF) % 3
+                if glitch_type == 0:
+                    # Jitter position
+                    draw_x += ((rng >> 24) & 0xFF) % 3 - 1
+                    draw_y -= (rng >> 32) & 1 # Only up/same
+                elif glitch_type == 1:
+                    # Change character
+                    ch = GLITCH_CHARS[((rng >> 40) & 0xFF) % len(GLITCH_CHARS)]
+                elif glitch_type == 2:
+                    attr |= curses.A_REVERSE
+
+            addstr_clipped(stdscr, height, width, draw_y, draw_x, ch, attr)
+
+        self._rng_state = rng
 
     def render_style_rain(self, stdscr: curses.window, start_y: int) -> None:
-        lines = self.logo_lines
-        height, width = stdscr.getmaxyx()
-        max_len = max(len(line) for line in lines)
-        base_x = max(0, (width - max_len) // 2)
-
-        for row, line in enumerate(lines):
-            for col, ch in enumerate(line):
-                if ch == " ":
-                    continue
+        height, width = self._dims
+        base_x = max(0, (width - self._logo_max_len) // 2)
+        if not (self.use_color and self.color_pairs):
+            for row, col, text in self._logo_segments:
+                addstr_clipped(stdscr, height, width, start_y + row, base_x + col, text)
+            return
 
-                attr = 0
-                if self.use_color and self.color_pairs:
-                    # Vertical flow falling down
-                    idx = (row - (self.frame // 2)) % len(self.color_pairs)
-                    attr = curses.color_pair(self.color_pairs[idx])
+        pair_attrs = [curses.color_pair(pair_id) for pair_id in self.color_pairs]
+        pair_count = len(pair_attrs)
+        frame = self.frame
+        bold = curses.A_BOLD
 
-                    # Sparkles
-                    if (col * 7 + row * 13 + self.frame) % 17 == 0:
-                         attr |= curses.A_BOLD
+        for row, col, text in self._logo_segments:
+            # Vertical flow falling down
+            attrs = [pair_attrs[(row - (frame // 2)) % pair_count]] * len(text)
+            # Sparkles where (col * 7 + row * 13 + frame) % 17 == 0; 5 * 7 == 1 (mod 17)
+            for offset in range(-5 * (col * 7 + row * 13 + frame) % 17, len(text), 17):
+                attrs[offset] |= bold
 
-                addstr_safe(stdscr, start_y + row, base_x + col, ch, attr)
+            addstr_runs(stdscr, height, width, start_y + row, base_x + col, text, attrs)
 
     def run(self, stdscr: curses.window) -> None:
         stdscr.keypad(True)
@@ -508,41 +823,78 @@ class CursesApp:
         self.init_colors()
         if self.active_screen == "main":
             self.refresh_models()
+        try:
+            self.main_loop(stdscr)
+        finally:
+            self.flush_config()
+            # The worker may still be using the connection; close it from there.
+            self._worker.submit(self._models_client.close)
+
+    def main_loop(self, stdscr: curses.window) -> None:
         while not self.should_exit:
-            stdscr.erase()
+            self.poll_models_future()
+            dims = stdscr.getmaxyx()
+            if dims != self._dims:
+                self._dims = dims
+                self._static_dirty = True
             if self.active_screen == "main":
-                self.render_main(stdscr)
+                # Only the logo animates; the rest is redrawn when invalidated.
+                if self._static_dirty:
+                    stdscr.erase()
+                    self.render_main_static(stdscr)
+                    self._static_dirty = False
+                else:
+                    self.clear_logo_area(stdscr)
+                self.render_main_animated(stdscr)
             else:
+                stdscr.erase()
                 self.render_config(stdscr)
             stdscr.refresh()
             key = stdscr.getch()
             if key == curses.KEY_RESIZE:
                 continue
             if key == -1:
+                # Coalesce edits into one write after ~250ms of idle ticks.
+                if self._config_dirty and self.frame - self._last_dirty_frame > 5:
+                    self.flush_config()
                 self.frame += 1
                 continue
             if self.active_screen == "main":
                 self.handle_main_key(stdscr, key)
             else:
                 self.handle_config_key(key)
+            self._static_dirty = True
             self.frame += 1
 
-    def render_main(self, stdscr: curses.window) -> None:
+    def clear_logo_area(self, stdscr: curses.window) -> None:
+        # Animated glyphs stray at most one row above or below the logo.
+        height, width = self._dims
+        top = max(0, LOGO_START_Y - 1)
+        bottom = min(height, LOGO_START_Y + len(self.logo_lines) + 1)
+        for y in range(top, bottom):
+            try:
+                stdscr.move(y, 0)
+                stdscr.clrtoeol()
+            except curses.error:
+                pass
+
+    def render_main_animated(self, stdscr: curses.window) -> None:
+        self.render_logo(stdscr, LOGO_START_Y)
+
+    def render_main_static(self, stdscr: curses.window) -> None:
         try:
             curses.curs_set(0)
         except curses.error:
             pass
-        y = 1
-        start_y = y
-        self.render_logo(stdscr, start_y)
-        y = start_y + len(self.logo_lines) + 1
-        height, width = stdscr.getmaxyx()
+        y = LOGO_START_Y + len(self.logo_lines) + 1
+        height, width = self._dims
         rows: list[tuple[str, str, str, int]] = []
         max_row = 0
         for key in MODEL_KEYS:
             label = f"{MODEL_LABELS[key]}:".ljust(8)
-            owner = self.config["models"].get(key, {}).get("owned_by") or "owned_by"
-            model_id = self.config["models"].get(key, {}).get("id") or "model_id"
+            entry = self.config["models"][key]
+            owner = entry["owned_by"] or "owned_by"
+            model_id = entry["id"] or "model_id"
             row_width = len(label) + 1 + len(owner) + len(" | ") + len(model_id)
             max_row = max(max_row, row_width)
             rows.append((label, owner, model_id, row_width))
@@ -550,68 +902,72 @@ class CursesApp:
         content_width = max(max_row, len(hint), len(self.status_message))
         x = max(2, (width - content_width) // 2)
         for idx, (label, owner, model_id, _row_width) in enumerate(rows):
-            addstr_safe(stdscr, y, x, label)
+            addstr_clipped(stdscr, height, width, y, x, label)
             owner_x = x + len(label) + 1
             owner_attr = (
                 curses.A_REVERSE
                 if (idx == self.main_focus_row and self.main_focus_field == 0)
                 else 0
             )
-            addstr_safe(stdscr, y, owner_x, owner, owner_attr)
+            addstr_clipped(stdscr, height, width, y, owner_x, owner, owner_attr)
             sep = " | "
             sep_x = owner_x + len(owner)
-            addstr_safe(stdscr, y, sep_x, sep)
+            addstr_clipped(stdscr, height, width, y, sep_x, sep)
             model_x = sep_x + len(sep)
             model_attr = (
                 curses.A_REVERSE
                 if (idx == self.main_focus_row and self.main_focus_field == 1)
                 else 0
             )
-            addstr_safe(stdscr, y, model_x, model_id, model_attr)
+            addstr_clipped(stdscr, height, width, y, model_x, model_id, model_attr)
             y += 1
         y += 1
-        addstr_safe(stdscr, y, x, hint)
+        addstr_clipped(stdscr, height, width, y, x, hint)
         y += 1
         if self.status_message:
-            addstr_safe(stdscr, y, x, self.status_message)
+            addstr_clipped(stdscr, height, width, y, x, self.status_message)
 
     def render_config(self, stdscr: curses.window) -> None:
         y = 1
-        height, width = stdscr.getmaxyx()
+        height, width = self._dims
         x = max(2, (width - 60) // 2)
-        addstr_safe(stdscr, y, x, "-----")
+        addstr_clipped(stdscr, height, width, y, x, "-----")
         y += 1
-        addstr_safe(stdscr, y, x, "Credentials")
+        addstr_clipped(stdscr, height, width, y, x, "Credentials")
         y += 1
-        addstr_safe(stdscr, y, x, "-----")
+        addstr_clipped(stdscr, height, width, y, x, "-----")
         y += 1
 
-        base_url_value = self.config.get("base_url", "")
+        base_url_value = self.field_text("base_url")
         base_label = "BASE_URL:"
         base_x = x + len(base_label) + 1
         base_focus = self.config_fields[self.config_focus_index] == "base_url"
         base_display = base_url_value if base_focus else (base_url_value or "<unset>")
-        addstr_safe(stdscr, y, x, base_label)
-        addstr_safe(stdscr, y, base_x, base_display, curses.A_REVERSE if base_focus else 0)
+        addstr_clipped(stdscr, height, width, y, x, base_label)
+        addstr_clipped(
+            stdscr, height, width, y, base_x, base_display, curses.A_REVERSE if base_focus else 0
+        )
         base_y = y
         y += 1
 
-        api_key_value = self.config.get("api_key", "")
+        api_key_value = self.field_text("api_key")
         api_label = "API_KEY:"
         api_x = x + len(api_label) + 1
         api_focus = self.config_fields[self.config_focus_index] == "api_key"
-        api_display = api_key_value if api_focus else mask_secret(api_key_value)
-        addstr_safe(stdscr, y, x, api_label)
-        addstr_safe(stdscr, y, api_x, api_display, curses.A_REVERSE if api_focus else 0)
+        api_display = api_key_value if api_focus else self.masked_api_key(api_key_value)
+        addstr_clipped(stdscr, height, width, y, x, api_label)
+        addstr_clipped(
+            stdscr, height, width, y, api_x, api_display, curses.A_REVERSE if api_focus else 0
+        )
         api_y = y
         y += 1
 
         y += 1
-        addstr_safe(stdscr, y, x, "-----")
+        addstr_clipped(stdscr, height, width, y, x, "-----")
         y += 1
-        addstr_safe(stdscr, y, x, "Toggles")
+        addstr_clipped(stdscr, height, width, y, x, "Toggles")
         y += 1
-        addstr_safe(stdscr, y, x, "-----")
+        addstr_clipped(stdscr, height, width, y, x, "-----")
         y += 1
 
         toggle_positions: dict[str, tuple[int, int]] = {}
@@ -619,15 +975,18 @@ class CursesApp:
             label = f"{TOGGLE_LABELS[key]}:"
             value = "ON" if self.config.get("toggles", {}).get(key, 0) else "OFF"
             toggle_focus = self.config_fields[self.config_focus_index] == key
-            addstr_safe(stdscr, y, x, label)
+            addstr_clipped(stdscr, height, width, y, x, label)
             value_x = x + len(label) + 1
-            addstr_safe(stdscr, y, value_x, value, curses.A_REVERSE if toggle_focus else 0)
+            addstr_clipped(
+                stdscr, height, width, y, value_x, value,
+                curses.A_REVERSE if toggle_focus else 0,
+            )
             toggle_positions[key] = (y, value_x)
             y += 1
 
         y += 1
         if self.status_message:
-            addstr_safe(stdscr, y, x, self.status_message)
+            addstr_clipped(stdscr, height, width, y, x, self.status_message)
 
         cursor_field = self.config_fields[self.config_focus_index]
         if cursor_field == "base_url":
@@ -643,7 +1002,7 @@ class CursesApp:
                 pass
 
     def place_cursor(self, stdscr: curses.window, y: int, x: int) -> None:
-        height, width = stdscr.getmaxyx()
+        height, width = self._dims
         if y < 0 or y >= height:
             return
         if x < 0:
@@ -659,127 +1018,150 @@ class CursesApp:
         except curses.error:
             return
 
-    def handle_main_key(self, stdscr: curses.window, key: int) -> None:
-        if key == curses.KEY_UP:
-            self.main_focus_row = max(0, self.main_focus_row - 1)
-            return
-        if key == curses.KEY_DOWN:
-            self.main_focus_row = min(len(MODEL_KEYS) - 1, self.main_focus_row + 1)
-            return
-        if key == curses.KEY_LEFT:
-            self.main_focus_field = 0
-            return
-        if key == curses.KEY_RIGHT:
-            self.main_focus_field = 1
-            return
-        if key in (ord("["), ord("a")):
-            self.cycle_main_option(-1)
-            return
-        if key in (ord("]"), ord("d")):
-            self.cycle_main_option(1)
-            return
-        if key in (ord("c"), ord("C")):
-            self.active_screen = "config"
-            self.status_message = ""
-            return
-        if key in (ord("b"), ord("B")):
-            self.refresh_models()
+    def move_main_focus(self, step: int) -> None:
+        self.main_focus_row = min(len(MODEL_KEYS) - 1, max(0, self.main_focus_row + step))
+
+    def set_main_focus_field(self, field: int) -> None:
+        self.main_focus_field = field
+
+    def open_config(self) -> None:
+        self.flush_config()
+        self.active_screen = "config"
+        self.status_message = ""
+
+    def launch_selection(self, stdscr: curses.window) -> None:
+        self.status_message = ""
+        error = validate_launch_requirements(self.config)
+        if error:
+            self.status_message = error
             return
-        if key in (ord("q"), ord("Q")):
+        self.flush_config()
+        error = self.launch_with_curses(stdscr)
+        if error:
+            self.status_message = error
+        else:
             self.should_exit = True
-            return
-        if key in (curses.KEY_ENTER, 10, 13):
-            self.status_message = ""
-            error = validate_launch_requirements(self.config)
-            if error:
-                self.status_message = error
-                return
-            error = self.launch_with_curses(stdscr)
-            if error:
-                self.status_message = error
-            else:
-                self.should_exit = True
+
+    def request_exit(self) -> None:
+        self.should_exit = True
+
+    _MAIN_KEY_HANDLERS: dict[int, Callable[[CursesApp, curses.window], None]] = {
+        key: handler
+        for keys, handler in (
+            ((curses.KEY_UP,), lambda app, stdscr: app.move_main_focus(-1)),
+            ((curses.KEY_DOWN,), lambda app, stdscr: app.move_main_focus(1)),
+            ((curses.KEY_LEFT,), lambda app, stdscr: app.set_main_focus_field(0)),
+            ((curses.KEY_RIGHT,), lambda app, stdscr: app.set_main_focus_field(1)),
+            ((ord("["), ord("a")), lambda app, stdscr: app.cycle_main_option(-1)),
+            ((ord("]"), ord("d")), lambda app, stdscr: app.cycle_main_option(1)),
+            ((ord("c"), ord("C")), lambda app, stdscr: app.open_config()),
+            ((ord("b"), ord("B")), lambda app, stdscr: app.refresh_models()),
+            ((ord("q"), ord("Q")), lambda app, stdscr: app.request_exit()),
+            ((curses.KEY_ENTER, 10, 13), lambda app, stdscr: app.launch_selection(stdscr)),
+        )
+        for key in keys
+    }
+
+    def handle_main_key(self, stdscr: curses.window, key: int) -> None:
+        handler = self._MAIN_KEY_HANDLERS.get(key)
+        if handler is not None:
+            handler(self, stdscr)
+
+    def close_config(self) -> None:
+        self.flush_config()
+        self.active_screen = "main"
+        self.refresh_models()
+
+    def move_config_focus(self, step: int) -> None:
+        self.flush_config()
+        self.config_focus_index = min(
+            len(self.config_fields) - 1, max(0, self.config_focus_index + step)
+        )
+
+    def toggle_config_field(self, field: str) -> None:
+        current = self.config.get("toggles", {}).get(field, 0)
+        self.config["toggles"][field] = 0 if current else 1
+        self._toggle_env[field] = str(self.config["toggles"][field])
+        self.mark_config_dirty()
+
+    _CONFIG_KEY_HANDLERS: dict[int, Callable[[CursesApp], None]] = {
+        27: lambda app: app.close_config(),
+        curses.KEY_UP: lambda app: app.move_config_focus(-1),
+        curses.KEY_DOWN: lambda app: app.move_config_focus(1),
+    }
 
     def handle_config_key(self, key: int) -> None:
-        if key == 27:
-            save_config(self.config)
-            self.active_screen = "main"
-            self.refresh_models()
-            return
-        if key == curses.KEY_UP:
-            save_config(self.config)
-            self.config_focus_index = max(0, self.config_focus_index - 1)
-            return
-        if key == curses.KEY_DOWN:
-            save_config(self.config)
-            self.config_focus_index = min(
-                len(self.config_fields) - 1, self.config_focus_index + 1
-            )
+        handler = self._CONFIG_KEY_HANDLERS.get(key)
+        if handler is not None:
+            handler(self)
             return
 
         field = self.config_fields[self.config_focus_index]
-        if field in ("base_url", "api_key"):
+        if field in self._edit_bufs:
             self.handle_text_input(field, key)
             return
-        if key in (curses.KEY_ENTER, 10, 13, ord(" ")):
-            current = self.config.get("toggles", {}).get(field, 0)
-            self.config["toggles"][field] = 0 if current else 1
-            save_config(self.config)
+        if key in TOGGLE_KEYS:
+            self.toggle_config_field(field)
 
     def handle_text_input(self, field: str, key: int) -> None:
-        value = self.config.get(field, "")
-        cursor = min(self.config_cursor.get(field, 0), len(value))
+        buf = self._edit_bufs[field]
+        cursor = min(self.config_cursor.get(field, 0), len(buf))
         if key == curses.KEY_LEFT:
             if cursor > 0:
                 cursor -= 1
         elif key == curses.KEY_RIGHT:
-            if cursor < len(value):
+            if cursor < len(buf):
                 cursor += 1
         elif key in (curses.KEY_BACKSPACE, 127, 8):
             if cursor > 0:
-                value = value[: cursor - 1] + value[cursor:]
+                del buf[cursor - 1]
                 cursor -= 1
-                self.config[field] = value
+                self.mark_config_dirty()
         elif 0 <= key <= 255 and curses.ascii.isprint(key):
-            value = value[:cursor] + chr(key) + value[cursor:]
+            buf.insert(cursor, chr(key))
             cursor += 1
-            self.config[field] = value
+            self.mark_config_dirty()
         self.config_cursor[field] = cursor
+        if field == "api_key":
+            self._mask_cache = None
 
     def cycle_main_option(self, direction: int) -> None:
         key = MODEL_KEYS[self.main_focus_row]
+        entry = self.config["models"][key]
         if self.main_focus_field == 0:
-            owners = owner_options(self.models_by_owner)
+            owners = self._owner_options
             if not owners:
                 return
-            current = self.config["models"].get(key, {}).get("owned_by")
+            current = entry["owned_by"]
             if current in owners:
                 index = owners.index(current)
             else:
                 index = -1 if direction > 0 else 0
             new_owner = owners[(index + direction) % len(owners)]
             update_model_owner(self.config, key, new_owner)
+            self.mark_config_dirty()
             return
 
-        owner = self.config["models"].get(key, {}).get("owned_by")
+        owner = entry["owned_by"]
         if not owner:
             return
         models = model_options(self.models_by_owner, owner)
         if not models:
             return
-        current_id = self.config["models"].get(key, {}).get("id")
+        current_id = entry["id"]
         if current_id in models:
             index = models.index(current_id)
         else:
             index = -1 if direction > 0 else 0
         new_id = models[(index + direction) % len(models)]
         update_model_id(self.config, key, owner, new_id)
+        self.mark_config_dirty()
 
     def launch_with_curses(self, stdscr: curses.window) -> str | None:
         try:
             curses.def_prog_mode()
             curses.endwin()
-            return launch_claude(self.config, self.args)
+            return launch_claude(self.config, self.args, self._toggle_env)
         finally:
             curses.reset_prog_mode()
             try: